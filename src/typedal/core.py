@@ -12,7 +12,6 @@ import sys
 import types
 import typing
 import warnings
-from collections import defaultdict
 from copy import copy
 from decimal import Decimal
 from pathlib import Path
@@ -28,6 +27,7 @@ from typing_extensions import Self, Unpack
 
 from .config import TypeDALConfig, load_config
 from .helpers import (
+    DUMMY_QUERY,
     DummyQuery,
     all_annotations,
     all_dict,
@@ -642,6 +642,23 @@ class TypeDAL(pydal.DAL):  # type: ignore
 
         return wrapper
 
+    def define_many(
+        self, *models: Type[T], rnames: Optional[dict[Type[T], str]] = None, **kwargs: Any
+    ) -> list[Type[T]]:
+        """
+        Define multiple models in one call, all with the same extra `kwargs`.
+
+        `rnames` can be used to give specific models a different (real) table name.
+
+        Example:
+            db.define_many(Article, Tag, rnames={Tag: "w2p_tag"}, redefine=True, migrate=False)
+        """
+        rnames = rnames or {}
+        return [
+            self._define(model, **((kwargs | {"rname": rnames[model]}) if model in rnames else kwargs))
+            for model in models
+        ]
+
     # def drop(self, table_name: str) -> None:
     #     """
     #     Remove a table by name (both on the database level and the typedal level).
@@ -820,6 +837,8 @@ class TableMeta(type):
     _db: TypeDAL | None = None
     _table: Table | None = None
     _relationships: dict[str, Relationship[Any]] | None = None
+    # 'table.id > 0', built once so QueryBuilder can recognize it by identity:
+    _default_query: Query | None = None
 
     #########################
     # TypeDAL custom logic: #
@@ -832,6 +851,7 @@ class TableMeta(type):
         self._db = db
         self._table = table
         self._relationships = relationships
+        self._default_query = typing.cast(Query, table.id > 0)
 
     def __getattr__(self, col: str) -> Optional[Field]:
         """
@@ -1040,6 +1060,12 @@ class TableMeta(type):
         """
         return QueryBuilder(self).count()
 
+    def exists(self: Type[T_MetaInstance]) -> bool:
+        """
+        See QueryBuilder.exists!
+        """
+        return QueryBuilder(self).exists()
+
     def first(self: Type[T_MetaInstance]) -> T_MetaInstance | None:
         """
         See QueryBuilder.first!
@@ -2171,12 +2197,31 @@ from .caching import (  # noqa: E402
     save_to_cache,
 )
 
+# field types that can be passed to QueryBuilder.where (-> field != None), built once instead of per query part:
+_WHERE_FIELD_TYPES = (Field, _Field)
+
+# select options that change which rows (or in which order) a query returns, so chunk() can't page by id:
+_OFFSET_CHUNK_OPTIONS = ("orderby", "groupby", "having", "distinct", "limitby", "left", "join")
+
 
 class QueryBuilder(typing.Generic[T_MetaInstance]):
     """
     Abstration on top of pydal's query system.
     """
 
+    # a new builder is created for every chained call (.where, .select, ...), so keep them small:
+    __slots__ = (
+        "_aliases",
+        "_count",
+        "_table",
+        "metadata",
+        "model",
+        "query",
+        "relationships",
+        "select_args",
+        "select_kwargs",
+    )
+
     model: Type[T_MetaInstance]
     query: Query
     select_args: list[Any]
@@ -2200,13 +2245,16 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             MyTable.where(...) -> QueryBuilder[MyTable]
         """
         self.model = model
-        table = model._ensure_table_defined()
-        default_query = typing.cast(Query, table.id > 0)
-        self.query = add_query or default_query
+        table = self._table = model._ensure_table_defined()
+        self.query = add_query or model._default_query or typing.cast(Query, table.id > 0)
         self.select_args = select_args or []
         self.select_kwargs = select_kwargs or {}
         self.relationships = relationships or {}
         self.metadata = metadata or {}
+        # alias -> aliased relationship table, see _aliased_table:
+        self._aliases: dict[str, Type[TypedTable]] = {}
+        # total (unpaginated) count, carried over to the builder of a page so .next()/.previous() can reuse it:
+        self._count: Optional[int] = None
 
     def __str__(self) -> str:
         """
@@ -2232,16 +2280,13 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         """
         Querybuilder is truthy if it has any conditions.
         """
-        table = self.model._ensure_table_defined()
-        default_query = typing.cast(Query, table.id > 0)
-        return any(
-            [
-                self.query != default_query,
-                self.select_args,
-                self.select_kwargs,
-                self.relationships,
-                self.metadata,
-            ]
+        return bool(
+            self.select_args
+            or self.select_kwargs
+            or self.relationships
+            or self.metadata
+            # the default query is shared per table, so identity is enough (no SQL rendering like `!=` does):
+            or self.query is not self.model._default_query
         )
 
     def _extend(
@@ -2308,19 +2353,19 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             .where(lambda table: table.id == 5, lambda table: table.id == 6) == (table.id == 5) | (table.id=6)
         """
         new_query = self.query
-        table = self.model._ensure_table_defined()
+        table = self._table
 
         for field, value in filters.items():
             new_query &= table[field] == value
 
-        subquery: DummyQuery | Query = DummyQuery()
+        subquery: DummyQuery | Query = DUMMY_QUERY
         for query_or_lambda in queries_or_lambdas:
             if isinstance(query_or_lambda, _Query):
                 subquery |= typing.cast(Query, query_or_lambda)
             elif callable(query_or_lambda):
                 if result := query_or_lambda(self.model):
                     subquery |= result
-            elif isinstance(query_or_lambda, (Field, _Field)) or is_typed_field(query_or_lambda):
+            elif isinstance(query_or_lambda, _WHERE_FIELD_TYPES) or is_typed_field(query_or_lambda):
                 subquery |= typing.cast(Query, query_or_lambda != None)
             else:
                 raise ValueError(f"Unexpected query type ({type(query_or_lambda)}).")
@@ -2400,20 +2445,17 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         """
         existing = self.metadata.get("cache", {})
 
-        metadata: Metadata = {}
-
         cache_meta = typing.cast(
             CacheMetadata,
-            self.metadata.get("cache", {})
-            | {
+            {
+                **existing,
                 "enabled": True,
-                "depends_on": existing.get("depends_on", []) + [str(_) for _ in deps],
+                "depends_on": [*existing.get("depends_on", ()), *map(str, deps)],
                 "expires_at": get_expire(expires_at=expires_at, ttl=ttl),
             },
         )
 
-        metadata["cache"] = cache_meta
-        return self._extend(metadata=metadata)
+        return self._extend(metadata={"cache": cache_meta})
 
     def _get_db(self) -> TypeDAL:
         if db := self.model._db:
@@ -2421,6 +2463,17 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         else:  # pragma: no cover
             raise EnvironmentError("@define or db.define is not called on this class yet!")
 
+    def _aliased_table(self, key: str, relation: Relationship[Any], db: TypeDAL) -> Type[TypedTable]:
+        """
+        Get the table of a relationship, aliased as `key_hash` so the same table can be joined multiple times.
+
+        The relationships of a builder don't change, so each alias is only created once per builder.
+        """
+        alias = f"{key}_{hash(relation)}"
+        if (other := self._aliases.get(alias)) is None:
+            other = self._aliases[alias] = relation.get_table(db).with_alias(alias)
+        return other
+
     def _select_arg_convert(self, arg: Any) -> Any:
         # typedfield are not really used at runtime anymore, but leave it in for safety:
         if isinstance(arg, TypedField):  # pragma: no cover
@@ -2461,9 +2514,19 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         db = self._get_db()
         return str(db(self.query)._update(**fields))
 
-    def _before_query(self, mut_metadata: Metadata, add_id: bool = True) -> tuple[Query, list[Any], SelectKwargs]:
-        select_args = [self._select_arg_convert(_) for _ in self.select_args] or [self.model.ALL]
-        select_kwargs = self.select_kwargs.copy()
+    def _before_query(
+        self, db: TypeDAL, mut_metadata: Metadata, add_id: bool = True
+    ) -> tuple[Query, list[Any], SelectKwargs]:
+        if not self.select_args:
+            select_args = [self.model.ALL]
+        elif any(isinstance(_, TypedField) for _ in self.select_args):
+            select_args = [self._select_arg_convert(_) for _ in self.select_args]
+        else:
+            # nothing to convert, but a copy is still required since fields can be appended below:
+            select_args = self.select_args.copy()
+
+        # only the relationship logic modifies the kwargs (limitby, join, left):
+        select_kwargs = self.select_kwargs.copy() if self.relationships else self.select_kwargs
         query = self.query
         model = self.model
         mut_metadata["query"] = query
@@ -2474,9 +2537,12 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         if add_id and f"{tablename}.id" not in select_fields:
             # fields of other selected, but required ID is missing.
             select_args.append(model.id)
+            select_fields += f", {model.id}"
 
         if self.relationships:
-            query, select_args = self._handle_relationships_pre_select(query, select_args, select_kwargs, mut_metadata)
+            query, select_args = self._handle_relationships_pre_select(
+                db, query, select_args, select_kwargs, mut_metadata, select_fields
+            )
 
         return query, select_args, select_kwargs
 
@@ -2486,7 +2552,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         """
         db = self._get_db()
 
-        query, select_args, select_kwargs = self._before_query({}, add_id=add_id)
+        query, select_args, select_kwargs = self._before_query(db, {}, add_id=add_id)
 
         return str(db(query)._select(*select_args, **select_kwargs))
 
@@ -2496,7 +2562,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         """
         return self.to_sql()
 
-    def _collect_cached(self, metadata: Metadata) -> "TypedRows[T_MetaInstance] | None":
+    def _collect_cached(self, db: TypeDAL, metadata: Metadata) -> "TypedRows[T_MetaInstance] | None":
         expires_at = metadata["cache"].get("expires_at")
         metadata["cache"] |= {
             # key is partly dependant on cache metadata but not these:
@@ -2519,7 +2585,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         metadata["cache"]["expires_at"] = expires_at
         metadata["cache"]["key"] = key
 
-        return load_from_cache(key, self._get_db())
+        return load_from_cache(key, db)
 
     def execute(self, add_id: bool = False) -> Rows:
         """
@@ -2528,7 +2594,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         db = self._get_db()
         metadata = typing.cast(Metadata, self.metadata.copy())
 
-        query, select_args, select_kwargs = self._before_query(metadata, add_id=add_id)
+        query, select_args, select_kwargs = self._before_query(db, metadata, add_id=add_id)
 
         return db(query).select(*select_args, **select_kwargs)
 
@@ -2544,10 +2610,10 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         db = self._get_db()
         metadata = typing.cast(Metadata, self.metadata.copy())
 
-        if metadata.get("cache", {}).get("enabled") and (result := self._collect_cached(metadata)):
+        if metadata.get("cache", {}).get("enabled") and (result := self._collect_cached(db, metadata)):
             return result
 
-        query, select_args, select_kwargs = self._before_query(metadata, add_id=add_id)
+        query, select_args, select_kwargs = self._before_query(db, metadata, add_id=add_id)
 
         metadata["sql"] = db(query)._select(*select_args, **select_kwargs)
 
@@ -2556,7 +2622,9 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
 
         rows: Rows = db(query).select(*select_args, **select_kwargs)
 
-        metadata["final_query"] = str(query)
+        # the query is stored as-is (like metadata["query"]): rendering its SQL on every collect is wasted work,
+        # since it's only for debugging. str() gives the old value and caching json-dumps it as str.
+        metadata["final_query"] = query
         metadata["final_args"] = [str(_) for _ in select_args]
         metadata["final_kwargs"] = select_kwargs
 
@@ -2571,7 +2639,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             # harder: try to match rows to the belonging objects
             # assume structure of {'table': <data>} per row.
             # if that's not the case, return default behavior again
-            typed_rows = self._collect_with_relationships(rows, metadata=metadata, _to=_to)
+            typed_rows = self._collect_with_relationships(db, rows, metadata=metadata, _to=_to)
 
         # only saves if requested in metadata:
         return save_to_cache(typed_rows, rows)
@@ -2598,12 +2666,19 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
 
     def _handle_relationships_pre_select(
         self,
+        db: TypeDAL,
         query: Query,
         select_args: list[Any],
         select_kwargs: SelectKwargs,
         metadata: Metadata,
+        select_fields: str,
     ) -> tuple[Query, list[Any]]:
-        db = self._get_db()
+        """
+        Add the joins and select fields required for the relationships.
+
+        `select_fields` is the string version of select_args (', '-separated) and is kept in sync while adding fields,
+        so it doesn't have to be rebuilt for every relationship.
+        """
         model = self.model
 
         metadata["relationships"] = set(self.relationships.keys())
@@ -2613,8 +2688,7 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             if not relation.condition or relation.join != "inner":
                 continue
 
-            other = relation.get_table(db)
-            other = other.with_alias(f"{key}_{hash(relation)}")
+            other = self._aliased_table(key, relation, db)
             condition = relation.condition(model, other)
             if callable(relation.condition_and):
                 condition &= relation.condition_and(model, other)
@@ -2648,15 +2722,17 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             other = relation.get_table(db)
             method: JOIN_OPTIONS = relation.join or DEFAULT_JOIN_OPTION
 
-            select_fields = ", ".join([str(_) for _ in select_args])
             pre_alias = str(other)
+            prefix = f"{pre_alias}."
 
-            if f"{other}." not in select_fields:
+            if prefix not in select_fields:
                 # no fields of other selected. add .ALL:
                 select_args.append(other.ALL)
-            elif f"{other}.id" not in select_fields:
+                select_fields += f", {other.ALL}"
+            elif f"{prefix}id" not in select_fields:
                 # fields of other selected, but required ID is missing.
                 select_args.append(other.id)
+                select_fields += f", {other.id}"
 
             if relation.on:
                 # if it has a .on, it's always a left join!
@@ -2667,91 +2743,112 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
                 left.extend(on)
             elif method == "left":
                 # .on not given, generate it:
-                other = other.with_alias(f"{key}_{hash(relation)}")
+                other = self._aliased_table(key, relation, db)
                 condition = typing.cast(Query, relation.condition(model, other))
                 if callable(relation.condition_and):
                     condition &= relation.condition_and(model, other)
                 left.append(other.on(condition))
             else:
                 # else: inner join (handled earlier)
-                other = other.with_alias(f"{key}_{hash(relation)}")  # only for replace
-
-            # if no fields of 'other' are included, add other.ALL
-            # else: only add other.id if missing
-            select_fields = ", ".join([str(_) for _ in select_args])
+                other = self._aliased_table(key, relation, db)  # only for replace
 
             post_alias = str(other).split(" AS ")[-1]
             if pre_alias != post_alias:
-                # replace .select's with aliased:
-                select_fields = select_fields.replace(
-                    f"{pre_alias}.",
-                    f"{post_alias}.",
-                )
-
-                select_args = select_fields.split(", ")
+                # replace .select's with aliased (only the args that refer to 'other', the rest stays as-is):
+                aliased_prefix = f"{post_alias}."
+                select_fields = select_fields.replace(prefix, aliased_prefix)
+
+                new_select_args = []
+                for arg in select_args:
+                    arg_str = str(arg)
+                    if prefix not in arg_str:
+                        new_select_args.append(arg)
+                    elif isinstance(arg, pydal.objects.SQLALL):
+                        # table.ALL -> separate (aliased) fields
+                        new_select_args.extend(arg_str.replace(prefix, aliased_prefix).split(", "))
+                    else:
+                        new_select_args.append(arg_str.replace(prefix, aliased_prefix))
+
+                select_args = new_select_args
 
         select_kwargs["left"] = left
         return query, select_args
 
     def _collect_with_relationships(
-        self, rows: Rows, metadata: Metadata, _to: Type["TypedRows[Any]"]
+        self, db: TypeDAL, rows: Rows, metadata: Metadata, _to: Type["TypedRows[Any]"]
     ) -> "TypedRows[T_MetaInstance]":
         """
         Transform the raw rows into Typed Table model instances.
         """
-        db = self._get_db()
-        main_table = self.model._ensure_table_defined()
-
-        records = {}
-        seen_relations: dict[str, set[str]] = defaultdict(set)  # main id -> set of col + id for relation
+        main_table = self._table
 
+        # group the joined rows per main record first (keeps the order in which main ids first appear):
+        rows_per_id: dict[Any, list[Row]] = {}
         for row in rows:
-            main = row[main_table]
-            main_id = main.id
-
-            if main_id not in records:
-                records[main_id] = self.model(main)
-                records[main_id]._with = list(self.relationships.keys())
-
-                # setup up all relationship defaults (once)
-                for col, relationship in self.relationships.items():
-                    records[main_id][col] = [] if relationship.multiple else None
-
-            # now add other relationship data
-            for column, relation in self.relationships.items():
-                relationship_column = f"{column}_{hash(relation)}"
-
-                # relationship_column works for aliases with the same target column.
-                # if col + relationship not in the row, just use the regular name.
-
-                relation_data = (
-                    row[relationship_column] if relationship_column in row else row[relation.get_table_name()]
-                )
-
-                if relation_data.id is None:
-                    # always skip None ids
-                    continue
-
-                if f"{column}-{relation_data.id}" in seen_relations[main_id]:
-                    # speed up duplicates
-                    continue
-                else:
-                    seen_relations[main_id].add(f"{column}-{relation_data.id}")
-
-                relation_table = relation.get_table(db)
-                # hopefully an instance of a typed table and a regular row otherwise:
-                instance = relation_table(relation_data) if looks_like(relation_table, TypedTable) else relation_data
+            main_id = row[main_table].id
+            if (grouped := rows_per_id.get(main_id)) is None:
+                rows_per_id[main_id] = [row]
+            else:
+                grouped.append(row)
+
+        # the relationships don't change while collecting, so only set these up once.
+        # every row comes from the same select, so the first row tells under which key each relationship's data is:
+        # `column_hash` works for aliases with the same target column, otherwise it's under the regular table name.
+        # typed_table is None if the relationship points to a regular (untyped) table.
+        first_row = rows.first()
+        relationships = []
+        for column, relation in self.relationships.items():
+            relationship_column = f"{column}_{hash(relation)}"
+            row_key = (
+                relationship_column
+                if first_row is not None and relationship_column in first_row
+                else relation.get_table_name()
+            )
 
-                if relation.multiple:
-                    # create list of T
-                    if not isinstance(records[main_id].get(column), list):  # pragma: no cover
-                        # should already be set up before!
-                        setattr(records[main_id], column, [])
+            relation_table = relation.get_table(db)
+            typed_table = relation_table if looks_like(relation_table, TypedTable) else None
+            relationships.append((column, row_key, relation.multiple, typed_table))
+        relationship_keys = list(self.relationships.keys())
 
-                    records[main_id][column].append(instance)
-                else:
-                    # create single T
-                    records[main_id][column] = instance
+        records = {}
+        for main_id, grouped_rows in rows_per_id.items():
+            record = records[main_id] = self.model(grouped_rows[0][main_table])
+            record._with = relationship_keys.copy()
+
+            # now add other relationship data.
+            # walk the rows per relationship, so each relationship has its own set of seen ids
+            # (plain ids, no (col, id) key to build per row). The order within each relationship stays the same.
+            for column, row_key, multiple, typed_table in relationships:
+                # setup up the relationship default (once); for multiple, keep the list around to append to:
+                related: list[Any] = []
+                record[column] = related if multiple else None
+                # bound once instead of a method lookup per row:
+                append_related = related.append
+
+                seen_ids: set[Any] = set()
+                add_seen = seen_ids.add
+                for row in grouped_rows:
+                    relation_data = row[row_key]
+
+                    if (relation_id := relation_data.id) is None:
+                        # always skip None ids
+                        continue
+
+                    if relation_id in seen_ids:
+                        # speed up duplicates
+                        continue
+                    else:
+                        add_seen(relation_id)
+
+                    # hopefully an instance of a typed table and a regular row otherwise:
+                    instance = typed_table(relation_data) if typed_table is not None else relation_data
+
+                    if multiple:
+                        # add to list of T
+                        append_related(instance)
+                    else:
+                        # create single T
+                        record[column] = instance
 
         return _to(rows, self.model, records, metadata=metadata)
 
@@ -2775,11 +2872,10 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
         """
         yield from self.collect()
 
-    def count(self, distinct: bool = None) -> int:
+    def _count_query(self, db: TypeDAL, distinct: bool = None) -> Query:
         """
-        Return the amount of rows matching the current query.
+        The current query, including the conditions of (inner) joined relationships.
         """
-        db = self._get_db()
         model = self.model
         query = self.query
 
@@ -2787,20 +2883,38 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             if (not relation.condition or relation.join != "inner") and not distinct:
                 continue
 
-            other = relation.get_table(db)
-            if not distinct:
-                # todo: can this lead to other issues?
-                other = other.with_alias(f"{key}_{hash(relation)}")
+            # todo: can aliasing (when not distinct) lead to other issues?
+            other = relation.get_table(db) if distinct else self._aliased_table(key, relation, db)
             query &= relation.condition(model, other)
 
-        return db(query).count(distinct)
+        return query
+
+    def count(self, distinct: bool = None) -> int:
+        """
+        Return the amount of rows matching the current query.
+        """
+        db = self._get_db()
+        return db(self._count_query(db, distinct)).count(distinct)
+
+    def exists(self) -> bool:
+        """
+        Check whether any row matches the current query.
+
+        Cheaper than `bool(.count())`, since the database can stop at the first matching row (LIMIT 1).
+        """
+        db = self._get_db()
+        # without relationships, the count query is just the current query (e.g. the table's shared default query):
+        query = self._count_query(db) if self.relationships else self.query
+        # only the id is needed to know a row exists (Set.isempty() would select every column):
+        return bool(db(query).select(self._table.id, limitby=(0, 1), orderby_on_limitby=False))
 
     def __paginate(
         self,
         limit: int,
         page: int = 1,
     ) -> "QueryBuilder[T_MetaInstance]":
-        available = self.count()
+        # limitby doesn't change the count, so a builder from an earlier page already knows it:
+        available = self.count() if self._count is None else self._count
 
         _from = limit * (page - 1)
         _to = (limit * page) if limit else available
@@ -2815,7 +2929,9 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
             "min_max": (_from, _to),
         }
 
-        return self._extend(select_kwargs={"limitby": (_from, _to)}, metadata=metadata)
+        builder = self._extend(select_kwargs={"limitby": (_from, _to)}, metadata=metadata)
+        builder._count = available
+        return builder
 
     def paginate(self, limit: int, page: int = 1, verbose: bool = False) -> "PaginatedRows[T_MetaInstance]":
         """
@@ -2853,26 +2969,68 @@ class QueryBuilder(typing.Generic[T_MetaInstance]):
                     # Process each row within the chunk.
                     pass
             ```
+
+        Without custom ordering or joins, rows are fetched by id (`id > last id of the previous chunk`)
+        instead of with an offset, so the database doesn't have to skip over all earlier rows for every next chunk.
         """
-        page = 1
+        select_kwargs = self.select_kwargs
+        if (
+            chunk_size < 1
+            or any(option in select_kwargs for option in _OFFSET_CHUNK_OPTIONS)
+            or not self._only_main_table(self._get_db())
+        ):
+            # chunks don't need the pagination metadata (or the count query it requires), only the limit:
+            _from = 0
+
+            while rows := self._extend(select_kwargs={"limitby": (_from, _from + chunk_size)}).collect():
+                yield rows
+                _from += chunk_size
+
+            return
+
+        table = self._table
+        chunk_kwargs: SelectKwargs = {"limitby": (0, chunk_size), "orderby": table.id}
 
-        while rows := self.__paginate(chunk_size, page).collect():
+        builder = self._extend(select_kwargs=chunk_kwargs)
+        while rows := builder.collect():
             yield rows
-            page += 1
+
+            # records are keyed by (main table) id:
+            builder = self._extend(add_query=table.id > max(rows.records), select_kwargs=chunk_kwargs)
+
+    def _only_main_table(self, db: TypeDAL) -> bool:
+        """
+        Whether the query and select args only refer to the main table (so every row is one main record).
+
+        Relationships from .join() don't count, since limits are applied to the main table's ids for those.
+        """
+        main_table = str(self._table)
+        tablenames = set(db._adapter.tables(self.query))
+
+        for arg in self.select_args:
+            if isinstance(arg, pydal.objects.SQLALL):
+                tablenames.add(str(arg._table))
+            elif isinstance(arg, str):
+                tablenames.add(arg.split(".")[0] if "." in arg else main_table)
+            else:
+                tablenames.update(db._adapter.tables(self._select_arg_convert(arg)))
+
+        return tablenames <= {main_table}
 
     def first(self, verbose: bool = False) -> T_MetaInstance | None:
         """
         Get the first row matching the currently built query.
 
-        Also adds paginate, since it would be a waste to select more rows than needed.
+        Also adds a limit, since it would be a waste to select more rows than needed.
+        Unlike paginate, this doesn't need to count all matching rows first.
         """
-        if row := self.paginate(page=1, limit=1, verbose=verbose).first():
+        if row := self._extend(select_kwargs={"limitby": (0, 1)}).collect(verbose=verbose).first():
             return self.model.from_row(row)
         else:
             return None
 
     def _first(self) -> str:
-        return self._paginate(page=1, limit=1)
+        return self._extend(select_kwargs={"limitby": (0, 1)})._collect()
 
     def first_or_fail(self, exception: Exception = None, verbose: bool = False) -> T_MetaInstance:
         """
@@ -2,6 +2,7 @@
 ONLY USE IN COMBINATION WITH PY4WEB!
 """
 
+import threading
 import typing
 
 import threadsafevariable
@@ -23,13 +24,20 @@ class Fixture(_Fixture):  # type: ignore
 
 class PY4WEB_DAL_SINGLETON(MetaDAL):
     _instances: typing.ClassVar[typing.MutableMapping[str, AnyType]] = {}
+    _lock: typing.ClassVar[threading.Lock] = threading.Lock()
 
     def __call__(cls, uri: typing.Optional[str] = None, *args: typing.Any, **kwargs: typing.Any) -> AnyType:
         db_uid = kwargs.get("db_uid", hashlib_md5(repr(uri or (args, kwargs))).hexdigest())
-        if db_uid not in cls._instances:
-            cls._instances[db_uid] = super().__call__(uri, *args, **kwargs)
+        # lock-free fast path once the instance exists:
+        if (instance := cls._instances.get(db_uid)) is not None:
+            return instance
 
-        return cls._instances[db_uid]
+        with cls._lock:
+            # another thread could have created the instance while we were waiting for the lock:
+            if (instance := cls._instances.get(db_uid)) is None:
+                instance = cls._instances[db_uid] = super().__call__(uri, *args, **kwargs)
+
+        return instance
 
     def _clear(cls) -> None:
         cls._instances.clear()
@@ -67,8 +67,18 @@ def setup_web2py_tables(db: TypeDAL, migrate: bool = False) -> None:
     """
     Setup all the (default) web2py required tables.
     """
-    db.define(AuthUser, redefine=True, migrate=migrate)
-    db.define(AuthGroup, rname="w2p_auth_group", redefine=True, migrate=migrate)
-    db.define(AuthMembership, rname="w2p_auth_membership", redefine=True, migrate=migrate)
-    db.define(AuthPermission, rname="w2p_auth_permission", redefine=True, migrate=migrate)
-    db.define(AuthEvent, rname="w2p_auth_event", redefine=True, migrate=migrate)
+    db.define_many(
+        AuthUser,
+        AuthGroup,
+        AuthMembership,
+        AuthPermission,
+        AuthEvent,
+        rnames={
+            AuthGroup: "w2p_auth_group",
+            AuthMembership: "w2p_auth_membership",
+            AuthPermission: "w2p_auth_permission",
+            AuthEvent: "w2p_auth_event",
+        },
+        redefine=True,
+        migrate=migrate,
+    )
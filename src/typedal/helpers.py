@@ -4,9 +4,13 @@ Helpers that work independently of core.
 
 import datetime as dt
 import fnmatch
-import io
+import functools
+import inspect
+import os
+import re
 import types
 import typing
+import weakref
 from collections import ChainMap
 from typing import Any
 
@@ -19,6 +23,11 @@ if typing.TYPE_CHECKING:
 
 T = typing.TypeVar("T")
 
+# bound once at module level, these are used in the (hot) introspection helpers below:
+_get_origin = typing.get_origin
+_get_args = typing.get_args
+_UNION_TYPES = (types.UnionType, typing.Union)
+
 
 def is_union(some_type: type | types.UnionType) -> bool:
     """
@@ -28,14 +37,35 @@ def is_union(some_type: type | types.UnionType) -> bool:
         some_type: types.UnionType = type(int | str); typing.Union = typing.Union[int, str]
 
     """
-    return typing.get_origin(some_type) in (types.UnionType, typing.Union)
+    return _get_origin(some_type) in _UNION_TYPES
+
+
+V = typing.TypeVar("V")
+
+
+def _weak_cached(cache: "weakref.WeakKeyDictionary[type, V]", cls: type, compute: typing.Callable[[type], V]) -> V:
+    """
+    Get the value for a class from a (weak) per-class cache, computing and storing it on the first call.
+
+    Only for values that don't change after class creation.
+    """
+    try:
+        return cache[cls]
+    except KeyError:
+        result = cache[cls] = compute(cls)
+        return result
+
 
+_REVERSED_MRO_CACHE: "weakref.WeakKeyDictionary[type, tuple[type, ...]]" = weakref.WeakKeyDictionary()
 
-def reversed_mro(cls: type) -> typing.Iterable[type]:
+
+def reversed_mro(cls: type) -> tuple[type, ...]:
     """
     Get the Method Resolution Order (mro) for a class, in reverse order to be used with ChainMap.
+
+    The mro of a class doesn't change, so the result is cached per class.
     """
-    return reversed(getattr(cls, "__mro__", []))
+    return _weak_cached(_REVERSED_MRO_CACHE, cls, lambda c: tuple(reversed(c.__mro__)))
 
 
 def _all_annotations(cls: type) -> ChainMap[str, type]:
@@ -45,7 +75,9 @@ def _all_annotations(cls: type) -> ChainMap[str, type]:
     """
     # chainmap reverses the iterable, so reverse again beforehand to keep order normally:
 
-    return ChainMap(*(c.__annotations__ for c in reversed_mro(cls) if "__annotations__" in c.__dict__))
+    # only the class' own annotations (not inherited), empty ones are skipped:
+    annotations = (inspect.get_annotations(c) for c in reversed_mro(cls))
+    return ChainMap(*(a for a in annotations if a))
 
 
 def all_dict(cls: type) -> AnyDict:
@@ -55,16 +87,41 @@ def all_dict(cls: type) -> AnyDict:
     return dict(ChainMap(*(c.__dict__ for c in reversed_mro(cls))))  # type: ignore
 
 
+def _merge_annotations(cls: type) -> dict[str, type]:
+    """
+    Same result as dict(_all_annotations(cls)), without going through ChainMap's per-key lookups.
+
+    Updating from the last map to the first gives the same key order and the same winning values as the ChainMap.
+    """
+    merged: dict[str, type] = {}
+    for annotations in reversed(_all_annotations(cls).maps):
+        merged.update(annotations)
+    return merged
+
+
+_ANNOTATIONS_CACHE: "weakref.WeakKeyDictionary[type, dict[str, type]]" = weakref.WeakKeyDictionary()
+
+
+def _flat_annotations(cls: type) -> dict[str, type]:
+    """
+    Flattened version of `_all_annotations`, cached per class since annotations don't change after class creation.
+
+    The cached dict is shared, so it should never be mutated!
+    """
+    return _weak_cached(_ANNOTATIONS_CACHE, cls, _merge_annotations)
+
+
 def all_annotations(cls: type, _except: typing.Iterable[str] = None) -> dict[str, type]:
     """
     Wrapper around `_all_annotations` that filters away any keys in _except.
 
-    It also flattens the ChainMap to a regular dict.
+    It also flattens the ChainMap to a regular dict (a new one each call, so it's safe to mutate).
     """
-    if _except is None:
-        _except = set()
+    _all = _flat_annotations(cls)
+    if not _except:
+        return _all.copy()
 
-    _all = _all_annotations(cls)
+    _except = set(_except)
     return {k: v for k, v in _all.items() if k not in _except}
 
 
@@ -78,17 +135,20 @@ def instanciate(cls: typing.Type[T] | T, with_args: bool = False) -> T:
     If with_args: spread the generic args into the class creation
     (needed for e.g. TypedField(str), but not for list[str])
     """
-    if inner_cls := typing.get_origin(cls):
+    if isinstance(cls, type) and (type(cls) is type or not _get_origin(cls)):
+        # fast path for plain classes (str, int, TypedTable subclasses, ...).
+        # on 3.10, generics such as list[str] also pass the isinstance check, hence the origin check.
+        return typing.cast(T, cls())
+
+    if inner_cls := _get_origin(cls):
         if not with_args:
             return typing.cast(T, inner_cls())
 
-        args = typing.get_args(cls)
+        args = _get_args(cls)
         return typing.cast(T, inner_cls(*args))
 
-    if isinstance(cls, type):
-        return typing.cast(T, cls())
-
-    return cls
+    # not a class or generic, so already an instance:
+    return typing.cast(T, cls)
 
 
 def origin_is_subclass(obj: Any, _type: type) -> bool:
@@ -98,11 +158,8 @@ def origin_is_subclass(obj: Any, _type: type) -> bool:
     Example:
         origin_is_subclass(list[str], list) -> True
     """
-    return bool(
-        typing.get_origin(obj)
-        and isinstance(typing.get_origin(obj), type)
-        and issubclass(typing.get_origin(obj), _type)
-    )
+    origin = _get_origin(obj)
+    return isinstance(origin, type) and issubclass(origin, _type)
 
 
 def mktable(
@@ -114,14 +171,19 @@ def mktable(
     See Also:
          https://stackoverflow.com/questions/70937491/python-flexible-way-to-format-string-output-into-a-table-without-using-a-non-st
     """
+    # stringify every cell once, used for both the widths and the output:
+    rows = [[str(k), *map(str, list(v.values())[1:] if skip_first else v.values())] for k, v in data.items()]
+
     # get max col width
-    col_widths: list[int] = list(map(max, zip(*(map(lambda x: len(str(x)), (k, *v)) for k, v in data.items()))))
+    col_widths: list[int] = [max(map(len, column)) for column in zip(*rows)]
 
     # default numeric header if missing
     if not header:
         header = range(1, len(col_widths) + 1)
 
-    header_widths = map(lambda x: len(str(x)), header)
+    # materialize once, so an iterator header isn't exhausted before it's printed:
+    header_list: list[str | int] = list(header)
+    header_widths = [len(str(x)) for x in header_list]
 
     # correct column width if headers are longer
     col_widths = [max(c, h) for c, h in zip(col_widths, header_widths)]
@@ -132,26 +194,19 @@ def mktable(
     # create formating string
     fmt_str = "| %s |" % " | ".join(f"{{:<{i}}}" for i in col_widths)
 
-    output = io.StringIO()
     # header
-    print()
-    print(line, file=output)
-    print(fmt_str.format(*header), file=output)
-    print(line, file=output)
+    parts = [line, fmt_str.format(*header_list), line]
 
     # data
-    for k, v in data.items():
-        values = list(v.values())[1:] if skip_first else v.values()
-        print(fmt_str.format(k, *values), file=output)
+    parts.extend(fmt_str.format(*row) for row in rows)
 
     # footer
-    print(line, file=output)
+    parts.append(line)
 
-    return output.getvalue()
+    return "\n".join(parts) + "\n"
 
 
 K = typing.TypeVar("K")
-V = typing.TypeVar("V")
 
 
 def looks_like(v: Any, _type: type[Any]) -> bool:
@@ -163,7 +218,19 @@ def looks_like(v: Any, _type: type[Any]) -> bool:
         assert looks_like(list, list)
         assert looks_like(list[str], list)
     """
-    return isinstance(v, _type) or (isinstance(v, type) and issubclass(v, _type)) or origin_is_subclass(v, _type)
+    if isinstance(v, _type):
+        return True
+
+    if isinstance(v, type):
+        if issubclass(v, _type):
+            return True
+        if type(v) is type:
+            # plain class without an origin (on 3.10, generics like list[str] also pass isinstance(v, type))
+            return False
+
+    # inlined origin_is_subclass:
+    origin = _get_origin(v)
+    return isinstance(origin, type) and issubclass(origin, _type)
 
 
 def filter_out(mut_dict: dict[K, V], _type: type[T]) -> dict[K, type[T]]:
@@ -172,9 +239,53 @@ def filter_out(mut_dict: dict[K, V], _type: type[T]) -> dict[K, type[T]]:
 
     Modifies mut_dict and returns everything of type _type.
     """
-    return {k: mut_dict.pop(k) for k, v in list(mut_dict.items()) if looks_like(v, _type)}
+    matches: dict[K, type[T]] = {}
+    rest: dict[K, V] = {}
+    for k, v in mut_dict.items():
+        if looks_like(v, _type):
+            matches[k] = typing.cast(type[T], v)
+        else:
+            rest[k] = v
+
+    mut_dict.clear()
+    mut_dict.update(rest)
+    return matches
 
 
+R = typing.TypeVar("R")
+
+
+def _cache_hashable(fn: typing.Callable[[Any], R]) -> typing.Callable[[Any], R]:
+    """
+    Memoize a pure, single-argument function on annotations.
+
+    Unhashable arguments (e.g. Annotated with a dict as metadata) skip the cache and call fn directly.
+    Only a failing hash() falls back; a TypeError raised by fn itself is not retried.
+    """
+    cached = functools.lru_cache(maxsize=4096)(fn)
+
+    @functools.wraps(fn)
+    def wrapper(annotation: Any) -> R:
+        try:
+            hash(annotation)
+        except TypeError:  # unhashable annotation
+            return fn(annotation)
+
+        return cached(annotation)
+
+    return wrapper
+
+
+def _origin_args(annotation: Any) -> tuple[Any, tuple[Any, ...]]:
+    """
+    Get both typing.get_origin and typing.get_args of an annotation.
+
+    Not cached itself: its callers (unwrap_type, extract_type_optional) already are.
+    """
+    return _get_origin(annotation), _get_args(annotation)
+
+
+@_cache_hashable
 def unwrap_type(_type: type) -> type:
     """
     Get the inner type of a generic.
@@ -182,7 +293,7 @@ def unwrap_type(_type: type) -> type:
     Example:
         list[list[str]] -> str
     """
-    while args := typing.get_args(_type):
+    while args := _origin_args(_type)[1]:
         _type = args[0]
     return _type
 
@@ -201,6 +312,7 @@ def extract_type_optional(annotation: None) -> tuple[None, bool]:
     """
 
 
+@_cache_hashable
 def extract_type_optional(annotation: T | None) -> tuple[T | None, bool]:
     """
     Given an annotation, extract the actual type and whether it is optional.
@@ -208,16 +320,17 @@ def extract_type_optional(annotation: T | None) -> tuple[T | None, bool]:
     if annotation is None:
         return None, False
 
-    if origin := typing.get_origin(annotation):
-        args = typing.get_args(annotation)
-
-        if origin in (typing.Union, types.UnionType, typing.Optional) and args:
-            # remove None:
-            return next(_ for _ in args if _ and _ != types.NoneType and not isinstance(_, types.NoneType)), True
+    origin, args = _origin_args(annotation)
+    if origin and origin in _UNION_TYPES and args:
+        # remove None:
+        for arg in args:
+            if arg is not None and arg is not types.NoneType:
+                return arg, True
 
     return annotation, False
 
 
+@functools.lru_cache(maxsize=1024)
 def to_snake(camel: str) -> str:
     """
     Convert CamelCase to snake_case.
@@ -225,14 +338,29 @@ def to_snake(camel: str) -> str:
     See Also:
         https://stackoverflow.com/a/44969381
     """
+    # str.isupper() instead of an [A-Z] regex, so non-ASCII capitals (e.g. 'É') also start a new word:
     return "".join([f"_{c.lower()}" if c.isupper() else c for c in camel]).lstrip("_")
 
 
 class DummyQuery:
     """
     Placeholder to &= and |= actual query parts.
+
+    It holds no state, so every instantiation returns the same (slotted) instance.
     """
 
+    __slots__ = ()
+
+    _instance: typing.ClassVar[typing.Optional["DummyQuery"]] = None
+
+    def __new__(cls) -> "DummyQuery":
+        """
+        Return the shared instance, creating it on first use.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __or__(self, other: T) -> T:
         """
         For 'or': DummyQuery | Other == Other.
@@ -252,6 +380,9 @@ class DummyQuery:
         return False
 
 
+DUMMY_QUERY = DummyQuery()
+
+
 def as_lambda(value: T) -> typing.Callable[..., T]:
     """
     Wrap value in a callable.
@@ -259,26 +390,92 @@ def as_lambda(value: T) -> typing.Callable[..., T]:
     return lambda *_, **__: value
 
 
+@functools.lru_cache(maxsize=256)
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a single glob pattern to a regex (string), shared between different groups of patterns.
+    """
+    return fnmatch.translate(pattern)
+
+
+_GLOB_SPECIAL_RE = re.compile(r"[*?\[]")
+
+# fnmatch.fnmatch compares os.path.normcase'd strings, which makes it case-insensitive on Windows.
+# On posix normcase doesn't change anything, so it can be skipped there:
+_NORMCASE: typing.Callable[[str], str] | None = None if os.path.normcase("A/") == "A/" else os.path.normcase
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_globs(patterns: tuple[str, ...]) -> typing.Callable[[str], Any]:
+    """
+    Turn a group of glob patterns into a single predicate.
+
+    Simple shapes are handled with plain string methods instead of a regex:
+    'literal' (==), '*.suffix' (endswith) and 'prefix*' (startswith).
+    Anything else is translated into one compiled regex alternation.
+    """
+    exact: set[str] = set()
+    suffixes: list[str] = []
+    prefixes: list[str] = []
+    complex_patterns: list[str] = []
+
+    for pattern in patterns:
+        if not _GLOB_SPECIAL_RE.search(pattern):
+            exact.add(pattern)
+        elif pattern[0] == "*" and not _GLOB_SPECIAL_RE.search(pattern, 1):
+            suffixes.append(pattern[1:])
+        elif pattern[-1] == "*" and not _GLOB_SPECIAL_RE.search(pattern, 0, len(pattern) - 1):
+            prefixes.append(pattern[:-1])
+        else:
+            complex_patterns.append(pattern)
+
+    checks: list[typing.Callable[[str], Any]] = []
+    if exact:
+        checks.append(frozenset(exact).__contains__)
+    if suffixes:
+        checks.append(lambda s, _suffixes=tuple(suffixes): s.endswith(_suffixes))
+    if prefixes:
+        checks.append(lambda s, _prefixes=tuple(prefixes): s.startswith(_prefixes))
+    if complex_patterns:
+        regex = "|".join(f"(?:{_translate_glob(pattern)})" for pattern in complex_patterns)
+        checks.append(re.compile(regex).match)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    return lambda s: any(check(s) for check in checks)
+
+
 def match_strings(patterns: list[str] | str, string_list: list[str]) -> list[str]:
     """
     Glob but on a list of strings.
+
+    Every string is included at most once, in the order of `string_list`.
+    Like `fnmatch.fnmatch`, case is ignored where `os.path.normcase` does so (Windows).
     """
     if isinstance(patterns, str):
         patterns = [patterns]
 
-    matches = []
-    for pattern in patterns:
-        matches.extend([s for s in string_list if fnmatch.fnmatch(s, pattern)])
+    if not patterns:
+        return []
 
-    return matches
+    if _NORMCASE is None:
+        return list(filter(_compile_globs(tuple(patterns)), string_list))
+
+    predicate = _compile_globs(tuple(map(_NORMCASE, patterns)))
+    return [string for string in string_list if predicate(_NORMCASE(string))]
+
+
+# dt.UTC only exists since 3.11:
+_UTC: dt.tzinfo = getattr(dt, "UTC", dt.timezone.utc)
+_now = dt.datetime.now
 
 
 def utcnow() -> dt.datetime:
     """
     Replacement of datetime.utcnow.
     """
-    # return dt.datetime.now(dt.UTC)
-    return dt.datetime.now(dt.timezone.utc)
+    return _now(_UTC)
 
 
 def get_db(table: "TypedTable | Table") -> "DAL":
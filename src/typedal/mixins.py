@@ -4,12 +4,15 @@ This file contains example Mixins.
 Mixins can add reusable fields and behavior (optimally both, otherwise it doesn't add much).
 """
 
-import base64
+import contextlib
+import functools
 import os
+import threading
 import typing
 import warnings
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from slugify import slugify
 
@@ -41,8 +44,50 @@ class Mixin(_TypedTable):
     def __init_subclass__(cls, **kwargs: Any):
         """
         Ensures __settings__ exists for other mixins.
+
+        Every class gets its own copy, so settings of one table don't leak into its parent or sibling classes.
         """
-        cls.__settings__ = getattr(cls, "__settings__", None) or {}
+        cls.__settings__ = {**(getattr(cls, "__settings__", None) or {})}
+
+
+_NOW: ContextVar[Optional[datetime]] = ContextVar("typedal_now", default=None)
+
+
+def _now() -> datetime:
+    """
+    The current datetime, or the shared one when inside a `fast_now()` block.
+    """
+    return _NOW.get() or datetime.now()
+
+
+@contextlib.contextmanager
+def fast_now(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Use one timestamp for all TimestampsMixin rows written within this block, instead of datetime.now() per row.
+
+    Example:
+        with fast_now():
+            for row in rows:
+                row.update_record(...)  # all get the same 'updated_at'
+    """
+    token = _NOW.set(now or datetime.now())
+    try:
+        yield typing.cast(datetime, _NOW.get())
+    finally:
+        _NOW.reset(token)
+
+
+def _set_updated_at(_: Set, row: OpRow) -> None:
+    """
+    Callback function to update the 'updated_at' field before saving changes.
+
+    Doesn't depend on the table, so one function is shared by all TimestampsMixin tables.
+
+    Args:
+        _: Set: Unused parameter.
+        row (OpRow): The row to update.
+    """
+    row["updated_at"] = _now()
 
 
 class TimestampsMixin(Mixin):
@@ -50,8 +95,8 @@ class TimestampsMixin(Mixin):
     A Mixin class for adding timestamp fields to a model.
     """
 
-    created_at = DatetimeField(default=datetime.now, writable=False)
-    updated_at = DatetimeField(default=datetime.now, writable=False)
+    created_at = DatetimeField(default=_now, writable=False)
+    updated_at = DatetimeField(default=_now, writable=False)
 
     @classmethod
     def __on_define__(cls, db: TypeDAL) -> None:
@@ -63,17 +108,45 @@ class TimestampsMixin(Mixin):
         """
         super().__on_define__(db)
 
-        def set_updated_at(_: Set, row: OpRow) -> None:
-            """
-            Callback function to update the 'updated_at' field before saving changes.
+        cls._before_update.append(_set_updated_at)
+
+
+_RAND_POOL_SIZE = 4096
+_rand_pool = threading.local()
 
-            Args:
-                _: Set: Unused parameter.
-                row (OpRow): The row to update.
-            """
-            row["updated_at"] = datetime.now()
 
-        cls._before_update.append(set_updated_at)
+def _reset_rand_pool() -> None:
+    """
+    A forked child must not hand out the same bytes as its parent (or siblings).
+    """
+    global _rand_pool
+    _rand_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows (which doesn't fork)
+    os.register_at_fork(after_in_child=_reset_rand_pool)
+
+
+def _rand_bytes(n: int) -> bytes:
+    """
+    Get n cryptographically random bytes from a per-thread pool, refilled with os.urandom when exhausted.
+
+    This saves a syscall per insert when generating many slugs.
+    """
+    pool = _rand_pool
+    buf: bytes = getattr(pool, "buf", b"")
+    pos: int = getattr(pool, "pos", 0)
+    if pos + n > len(buf):
+        buf = pool.buf = os.urandom(max(_RAND_POOL_SIZE, n))
+        pos = 0
+
+    pool.pos = pos + n
+    return buf[pos : pos + n]
+
+
+# maps every byte value to one of the 64 urlsafe base64 characters (256 is a multiple of 64, so evenly):
+_URLSAFE_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+_URLSAFE_TABLE = bytes(_URLSAFE_ALPHABET[b & 0x3F] for b in range(256))
 
 
 def slug_random_suffix(length: int = 8) -> str:
@@ -81,10 +154,29 @@ def slug_random_suffix(length: int = 8) -> str:
     Generate a random suffix to make slugs unique, even when titles are the same.
 
     UUID4 uses 16 bytes, but 8 is probably more than enough given you probably don't have THAT much duplicate titles.
-    Strip away '=' to make it URL-safe
-        (even though 'urlsafe_b64encode' sounds like it should already be url-safe - it is not)
+    The result has the same length and alphabet as unpadded urlsafe base64 of `length` bytes
+        (one random byte per character, instead of encoding and then stripping the '=' padding).
+    """
+    return _rand_bytes(-(-length * 4 // 3)).translate(_URLSAFE_TABLE).decode()
+
+
+# longer titles are rarely repeated, so don't let them fill up the cache:
+_SLUGIFY_CACHE_MAX_LENGTH = 512
+
+
+@functools.lru_cache(maxsize=4096)
+def _slugify_cached(text: str) -> str:
+    return slugify(text)
+
+
+def _slugify(text: str) -> str:
     """
-    return base64.urlsafe_b64encode(os.urandom(length)).rstrip(b"=").decode().strip("=")
+    Memoized slugify for (short) text, since slugify is relatively expensive (unicode normalization, regexes).
+    """
+    if isinstance(text, str) and len(text) <= _SLUGIFY_CACHE_MAX_LENGTH:
+        return _slugify_cached(text)
+
+    return slugify(text)
 
 
 class SlugMixin(Mixin):
@@ -146,17 +238,22 @@ class SlugMixin(Mixin):
         """
         super().__on_define__(db)
 
+        # settings are fixed after class creation, so read them once here instead of for every inserted row:
+        slug_field = cls.__settings__["slug_field"]
+        suffix_len = cls.__settings__["slug_suffix"]
+
         # slugs should not be editable (for SEO reasons), so there is only a before insert hook:
         def generate_slug_before_insert(row: OpRow) -> None:
-            settings = cls.__settings__
+            text_input = row[slug_field]
+            generated_slug = _slugify(text_input)
 
-            text_input = row[settings["slug_field"]]
-            generated_slug = slugify(text_input)
+            if suffix_len:
+                # the suffix is urlsafe base64 ([A-Za-z0-9_-]), so a full second slugify() is not needed:
+                # lowercase, turn '_' into '-' and don't produce empty parts (double, leading or trailing dashes).
+                suffix = slug_random_suffix(suffix_len).replace("_", "-").lower()
+                generated_slug = "-".join(filter(None, (generated_slug, *suffix.split("-"))))
 
-            if suffix_len := settings["slug_suffix"]:
-                generated_slug += f"-{slug_random_suffix(suffix_len)}"
-
-            row["slug"] = slugify(generated_slug)
+            row["slug"] = generated_slug
 
         cls._before_insert.append(generate_slug_before_insert)
 
@@ -165,19 +262,21 @@ class SlugMixin(Mixin):
         """
         Find a row by its slug.
         """
-        builder = cls.where(slug=slug)
-        if join:
-            builder = builder.join()
+        if not join:
+            # slug is unique, so a plain single-row lookup is enough (no query builder, no count):
+            return cls(slug=slug)
 
-        return builder.first()
+        return cls.where(slug=slug).join().first()
 
     @classmethod
     def from_slug_or_fail(cls: typing.Type[T_MetaInstance], slug: str, join: bool = True) -> T_MetaInstance:
         """
         Find a row by its slug, or raise an error if it doesn't exist.
         """
-        builder = cls.where(slug=slug)
-        if join:
-            builder = builder.join()
+        if not join:
+            if row := cls(slug=slug):
+                return row
+
+            raise ValueError("Nothing found!")
 
-        return builder.first_or_fail()
+        return cls.where(slug=slug).join().first_or_fail()
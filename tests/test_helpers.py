@@ -1,3 +1,4 @@
+import ntpath
 import typing
 from datetime import datetime, timedelta
 
@@ -5,12 +6,16 @@ import pydal
 import pytest
 from pydal import DAL
 
+from src.typedal import helpers
 from src.typedal.caching import get_expire
 from src.typedal.helpers import (
+    DUMMY_QUERY,
     DummyQuery,
+    _cache_hashable,
     all_annotations,
     as_lambda,
     extract_type_optional,
+    filter_out,
     get_db,
     get_field,
     get_table,
@@ -50,6 +55,11 @@ class Child(Base):
 
 def test_all_annotations():
     assert all_annotations(Child) == {"a": int, "b": str, "c": float, "d": bool}
+    assert all_annotations(Child, _except=["b", "c"]) == {"a": int, "d": bool}
+
+    # results are cached, but mutating one should not affect the next call:
+    all_annotations(Child)["e"] = int
+    assert "e" not in all_annotations(Child)
 
 
 def test_instanciate():
@@ -81,6 +91,8 @@ def test_mktable():
 
     assert mktable(data, skip_first=False)
     assert mktable(data, header=["id", "name", "age", "occupation"])
+    # header may be any iterable, including a one-shot iterator:
+    assert "occupation" in mktable(data, header=iter(["id", "name", "age", "occupation"]))
 
 
 def test_unwrap():
@@ -99,6 +111,13 @@ def test_looks_like():
     assert not looks_like(list[str], str)
 
 
+def test_filter_out():
+    data = {"a": [], "b": "text", "c": list[int], "d": 1}
+
+    assert filter_out(data, list) == {"a": [], "c": list[int]}
+    assert data == {"b": "text", "d": 1}
+
+
 def test_extract():
     assert extract_type_optional(typing.Optional[bool]) == (bool, True)
     assert extract_type_optional(bool | None) == (bool, True)
@@ -106,6 +125,26 @@ def test_extract():
     assert extract_type_optional(bool) == (bool, False)
     assert extract_type_optional(None) == (None, False)
 
+    # unhashable annotations (e.g. a dict as Annotated metadata) skip the cache but still work:
+    unhashable = typing.Annotated[typing.Optional[bool], {"some": "metadata"}]
+    assert extract_type_optional(unhashable) == (unhashable, False)
+    assert unwrap_type(typing.Annotated[list[str], {}]) == str
+
+
+def test_cache_hashable():
+    calls = []
+
+    @_cache_hashable
+    def fails(annotation):
+        calls.append(annotation)
+        raise TypeError("from the function itself")
+
+    # a TypeError raised by the function is not mistaken for an unhashable argument (no second call):
+    with pytest.raises(TypeError):
+        fails(int)
+
+    assert calls == [int]
+
 
 def test_to_snake():
     assert to_snake("MyClass") == "my_class"
@@ -113,6 +152,11 @@ def test_to_snake():
     assert to_snake("myclass") == "myclass"
     assert to_snake("my_class") == "my_class"
     assert to_snake("my_Class") == "my__class"
+    assert to_snake("_PrivateClass") == "private_class"
+    assert to_snake("HTTPServer") == "h_t_t_p_server"
+    # non-ascii capitals also count:
+    assert to_snake("MyÉcole") == "my_école"
+    assert to_snake("CafÉ") == "caf_é"
 
 
 def test_dummy_query():
@@ -125,6 +169,8 @@ def test_dummy_query():
 
     assert not dummy
 
+    assert DummyQuery() is dummy is DUMMY_QUERY
+
 
 def test_as_lambda():
     o = {}
@@ -183,6 +229,26 @@ def test_match_strings():
     expected_matches = []
     assert sorted(match_strings(patterns, string_list)) == sorted(expected_matches)
 
+    # Test overlapping patterns (no duplicates, original order)
+    patterns = ["file*", "*.txt"]
+    assert match_strings(patterns, string_list) == string_list
+
+    # Test literal, prefix and mixed patterns
+    assert match_strings("file2.jpg", string_list) == ["file2.jpg"]
+    assert match_strings("file3*", string_list) == ["file3.txt"]
+    assert match_strings(["file?.png", "*.jpg", "file1.txt"], string_list) == ["file1.txt", "file2.jpg", "file4.png"]
+
+
+def test_match_strings_normcase(monkeypatch):
+    # like fnmatch.fnmatch, case is ignored where os.path.normcase does so (Windows):
+    monkeypatch.setattr(helpers, "_NORMCASE", ntpath.normcase)
+    string_list = ["File1.TXT", "file2.jpg", "FILE3.txt", "file4.PNG"]
+
+    assert match_strings("*.txt", string_list) == ["File1.TXT", "FILE3.txt"]
+    assert match_strings("FILE*", string_list) == string_list
+    assert match_strings("file1.txt", string_list) == ["File1.TXT"]
+    assert match_strings(["file?.png", "*.JPG"], string_list) == ["file2.jpg", "file4.PNG"]
+
 
 database = TypeDAL("sqlite:memory")
 assert database._db_uid
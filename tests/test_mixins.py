@@ -1,13 +1,22 @@
+import os
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 import pytest
+from slugify import slugify
 
-from src.typedal import TypeDAL, TypedTable
+from src.typedal import TypeDAL, TypedTable, mixins
 from src.typedal.fields import StringField, TypedField, UUIDField
-from src.typedal.mixins import Mixin, SlugMixin, TimestampsMixin
+from src.typedal.mixins import (
+    _SLUGIFY_CACHE_MAX_LENGTH,
+    Mixin,
+    SlugMixin,
+    TimestampsMixin,
+    _slugify,
+    fast_now,
+)
 
 
 class AllMixins(TypedTable, SlugMixin, TimestampsMixin, slug_field="name"):
@@ -70,6 +79,22 @@ def test_slug(db):
     with pytest.raises(ValueError):
         TableWithMixins.from_slug_or_fail("missing")
 
+    assert TableWithMixins.from_slug(row.slug, join=False).id == row.id
+    assert TableWithMixins.from_slug("missing", join=False) is None
+
+    assert TableWithMixins.from_slug_or_fail(row.slug, join=False).id == row.id
+
+    with pytest.raises(ValueError):
+        TableWithMixins.from_slug_or_fail("missing", join=False)
+
+    # very long titles skip the slugify cache, but give the same slug:
+    long_name = "A Very Long Title " * 50
+    assert len(long_name) > _SLUGIFY_CACHE_MAX_LENGTH
+    assert _slugify(long_name) == slugify(long_name)
+
+    row = TableWithMixins.insert(name=long_name)
+    assert row.slug.startswith(slugify(long_name))
+
 
 def test_timestamps(db):
     row = TableWithTimestamps.insert(unrelated="Hi")
@@ -85,6 +110,76 @@ def test_timestamps(db):
     assert updated_row.updated_at > updated_row.created_at
 
 
+def test_fast_now(db):
+    earlier = datetime.now().replace(microsecond=0) - timedelta(days=1)
+
+    with fast_now(earlier) as now:
+        assert now == earlier
+        first = TableWithTimestamps.insert(unrelated="first")
+        second = TableWithTimestamps.insert(unrelated="second")
+        first.update_record(unrelated="updated")
+
+    assert first.created_at == second.created_at == earlier
+    assert TableWithTimestamps(id=first.id).updated_at == earlier
+
+    # outside of the block, the real time is used again:
+    third = TableWithTimestamps.insert(unrelated="third")
+    assert third.created_at > earlier
+
+
+def test_settings_per_class():
+    class BySlugA(TypedTable, SlugMixin, slug_field="title"):
+        title: str
+
+    class BySlugB(TypedTable, SlugMixin, slug_field="name", slug_suffix_length=4):
+        name: str
+
+    class BySlugC(BySlugA, slug_field="subtitle"):
+        subtitle: str
+
+    assert BySlugA.__settings__ == {"slug_field": "title", "slug_suffix": 0}
+    assert BySlugB.__settings__ == {"slug_field": "name", "slug_suffix": 4}
+    assert BySlugC.__settings__ == {"slug_field": "subtitle", "slug_suffix": 0}
+    assert "slug_field" not in SlugMixin.__settings__
+
+
+def test_rand_pool_reset():
+    # called directly: a fresh pool replaces the old one
+    mixins._rand_bytes(8)
+    old_pool = mixins._rand_pool
+    assert old_pool.buf
+
+    mixins._reset_rand_pool()
+
+    assert mixins._rand_pool is not old_pool
+    assert not hasattr(mixins._rand_pool, "buf")
+    assert len(mixins._rand_bytes(8)) == 8
+    assert mixins._rand_pool.buf is not old_pool.buf
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available on this platform")
+def test_rand_pool_after_fork():
+    # the pool is filled before forking, so without the os.register_at_fork reset,
+    # parent and child would hand out the same next bytes:
+    mixins._rand_bytes(8)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process, coverage isn't collected here
+        os.close(read_fd)
+        os.write(write_fd, mixins._rand_bytes(16))
+        os._exit(0)
+
+    os.close(write_fd)
+    parent_bytes = mixins._rand_bytes(16)
+    with os.fdopen(read_fd, "rb") as f:
+        child_bytes = f.read()
+    os.waitpid(pid, 0)
+
+    assert len(child_bytes) == 16
+    assert child_bytes != parent_bytes
+
+
 def test_reusing(db):
     assert str(AllMixins.created_at) == "all_mixins.created_at"
     assert str(AllMixins.slug) == "all_mixins.slug"
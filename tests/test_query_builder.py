@@ -1,4 +1,5 @@
 import inspect
+import re
 import typing
 
 import pytest
@@ -91,6 +92,11 @@ def test_where_builder():
 
     assert TestQueryTable.first().id == TestQueryTable.select().first().id
 
+    # first only needs one row, no count:
+    db._timings.clear()
+    assert TestQueryTable.where(number=1).join().first().number == 1
+    assert not any("COUNT" in sql for sql, _ in db._timings)
+
     builder = TestQueryTable.where(lambda row: row.number < 3).where(TestQueryTable.number > 1)
     results = builder.collect()
     assert len(results) == 1
@@ -155,6 +161,10 @@ def test_where_builder():
     assert TestQueryTable.where(lambda row: row.id == 1, lambda row: row.id == 2).count() == 2
     assert TestQueryTable.where(lambda row: row.id == 1, lambda row: row.id == 99).count() == 1
 
+    assert TestQueryTable.where(id=1).exists()
+    assert not TestQueryTable.where(id=-1).exists()
+    assert TestQueryTable.exists()
+
     assert TestQueryTable.where(id=-1).first() is None
     with pytest.raises(ValueError):
         TestQueryTable.where(id=-1).collect_or_fail()
@@ -207,13 +217,23 @@ def test_select():
     assert not partial.relations[0].name
     assert partial.relations[0].value
 
+    # TypedField instances (instead of the pydal Field) also work as select args:
+    typed_field = TestQueryTable.__dict__["other"]
+    assert isinstance(typed_field, TypedField)
+    row = TestQueryTable.select(typed_field).first_or_fail()
+    assert row.other == "Something"
+    assert not row.number
+
 
 def test_paginate():
     _setup_data()
 
     result = TestQueryTable.join(method="left").paginate(limit=1, page=1)
 
+    db._timings.clear()
     result_two = result.next().previous()
+    # the total count is reused when going to another page:
+    assert not any("COUNT" in sql for sql, _ in db._timings)
 
     assert len(result) == 1 == len(result_two)
     assert len(result.first().relations) == 4 == len(result_two.first().relations)
@@ -293,6 +313,39 @@ def test_chunking():
 
     assert total == TestQueryTable.count()
 
+    all_ids = [row.id for row in TestQueryTable.select(orderby=TestQueryTable.id)]
+
+    # without custom ordering, chunks are selected by id instead of with an offset (also with relationships):
+    db._timings.clear()
+    assert [row.id for rows in TestQueryTable.join().chunk(2) for row in rows] == all_ids
+    assert not any(re.search(r"OFFSET [1-9]", sql) for sql, _ in db._timings)
+
+    # custom ordering still works (and doesn't need a count either):
+    db._timings.clear()
+    chunks = list(TestQueryTable.select(orderby=~TestQueryTable.id).chunk(2))
+    assert [row.id for rows in chunks for row in rows] == all_ids[::-1]
+    assert not any("COUNT" in sql for sql, _ in db._timings)
+
+    # (implicit) joins with other tables can yield multiple rows per record, so these still use an offset:
+    q, r = TestQueryTable, TestRelationship
+    chunks = list(q.select(q.ALL, r.ALL, left=r.on(r.querytable == q.id)).chunk(2))
+    assert sorted({row.id for rows in chunks for row in rows}) == all_ids
+
+    chunks = list(q.where(q.id == r.querytable).chunk(2))
+    assert [[row.id for row in rows] for rows in chunks] == [[1], [1], [2], [2]]
+
+    # fields of the main table only (by reference or name) can still be chunked by id:
+    db._timings.clear()
+    chunks = list(q.select(q.ALL, q.id, "number", "test_query_table.other").chunk(2))
+    assert [row.id for rows in chunks for row in rows] == all_ids
+    assert not any(re.search(r"OFFSET [1-9]", sql) for sql, _ in db._timings)
+
+    # other table in the select args (cross join):
+    db._timings.clear()
+    chunks = list(q.select(q.id, r.name).chunk(20))
+    assert sorted({row.id for rows in chunks for row in rows}) == all_ids
+    assert any("OFFSET 20" in sql for sql, _ in db._timings)
+
 
 def test_complex_join():
     _setup_data()
@@ -307,6 +360,8 @@ def test_complex_join():
     assert builder.count() == 4 == len(builder.collect())
 
     assert builder.collect()
+    assert builder.exists()
+    assert not builder.where(TestRelationship.value == 3).exists()  # only for querytable.number == 0
 
     # notation 2:
 